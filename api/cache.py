@@ -0,0 +1,39 @@
+from django.core.cache import cache
+
+# Every dashboard key embeds the version of its group; bumping a version on writes
+# retires all cached entries of that group at once without having to find and delete
+# them. Counts and rankings (stats, popular cars) and the activity feed change on
+# different writes, so each group has its own version and a login does not flush stats.
+DASHBOARD_STATS = 'stats'
+DASHBOARD_ACTIVITY = 'activity'
+DASHBOARD_TIMEOUT = 45
+
+
+def _version_key(group):
+    return f'dashboard:{group}:version'
+
+
+def dashboard_version(group):
+    """Return the current cache version of a dashboard group"""
+    return cache.get_or_set(_version_key(group), 1, timeout=None)
+
+
+def bump_dashboard_version(*groups):
+    """Invalidate every cached dashboard entry in the given groups"""
+    for group in groups:
+        key = _version_key(group)
+        cache.add(key, 1, timeout=None)
+        cache.incr(key)
+
+
+def get_dashboard_data(name, build, group=DASHBOARD_STATS):
+    """Return the cached dashboard payload for name, building and caching it on a miss
+
+    The payloads are the same for every user, so they are cached under a shared key.
+    """
+    key = f'dashboard:{name}:{dashboard_version(group)}'
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, DASHBOARD_TIMEOUT)
+    return data
@@ -1,120 +1,187 @@
 from django.core.management.base import BaseCommand
-import json
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection
 from authentication.models import User, LoginHistory
 from cars.models import Car
 from locations.models import Location
 from rentals.models import Rental
 
+from api.optional import orjson
+
+# Built once and reused for every row instead of instantiating an encoder per call
+COMPACT_ENCODER = DjangoJSONEncoder(separators=(',', ':'))
+PRETTY_ENCODER = DjangoJSONEncoder(indent=2)
+
+
+def dumps_row(row, pretty=False):
+    """Serialize one exported row to JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_UTC_Z | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(row, option=option)
+    encoder = PRETTY_ENCODER if pretty else COMPACT_ENCODER
+    return encoder.encode(row).encode()
+
+
+class JSONArrayWriter:
+    """File adapter that turns newline-delimited JSON rows into a JSON array
+
+    PostgreSQL's COPY ... TO STDOUT writes one record per line; this joins them with
+    commas on the wrapped file so the export keeps the same array layout.
+    """
+    
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+        self._partial = b''
+    
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self.f.write(b',' if self.count else b'[')
+            self.f.write(line)
+            self.count += 1
+        return len(data)
+    
+    def finish(self):
+        self.f.write(b']\n' if self.count else b'[]\n')
+
+
 class Command(BaseCommand):
     help = 'Export data from the database to JSON files'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--pretty', action='store_true', help='Indent the exported JSON for readability')
+        parser.add_argument('--gzip', action='store_true', help='Write gzip-compressed .json.gz files')
+
     def handle(self, *args, **kwargs):
+        self.pretty = kwargs.get('pretty', False)
+        self.gzip = kwargs.get('gzip', False)
         self.stdout.write(self.style.SUCCESS('Starting data export...'))
         
-        # Export users
-        self.export_users()
-        
-        # Export locations
-        self.export_locations()
-        
-        # Export cars
-        self.export_cars()
-        
-        # Export rentals
-        self.export_rentals()
-        
-        # Export login history
-        self.export_login_history()
+        # The exports read separate tables and write separate files, so they can
+        # overlap one table's query latency with another's serialization
+        exports = (
+            self.export_users,
+            self.export_locations,
+            self.export_cars,
+            self.export_rentals,
+            self.export_login_history,
+        )
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = [executor.submit(self._run_export, export) for export in exports]
+            for future in futures:
+                future.result()
         
         self.stdout.write(self.style.SUCCESS('Data export completed successfully!'))
     
+    def _run_export(self, export):
+        """Run one export in a worker thread on that thread's own database connection"""
+        close_old_connections()
+        try:
+            export()
+        finally:
+            connection.close()
+    
+    def _output_path(self, filename):
+        return f'{filename}.gz' if self.gzip else filename
+    
+    def _open_output(self, path):
+        """Open an export file for binary writing with a 1 MiB buffer, or through gzip"""
+        if self.gzip:
+            # Level 1 still shrinks JSON several times over at very little CPU cost
+            return gzip.open(path, 'wb', compresslevel=1)
+        return open(path, 'wb', buffering=1 << 20)
+    
+    def _stream_dump(self, path, rows_iter):
+        """Write rows to path as a JSON array one row at a time and return the row count"""
+        count = 0
+        with self._open_output(path) as f:
+            f.write(b'[')
+            for row in rows_iter:
+                if count:
+                    f.write(b',')
+                if self.pretty:
+                    f.write(b'\n  ' + dumps_row(row, pretty=True).replace(b'\n', b'\n  '))
+                else:
+                    f.write(dumps_row(row))
+                count += 1
+            f.write(b'\n]\n' if self.pretty and count else b']\n')
+        return count
+    
+    def _can_copy(self):
+        """Whether login history can be exported with PostgreSQL COPY (compact output only)"""
+        if connection.vendor != 'postgresql' or self.pretty:
+            return False
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+        # copy_expert() is psycopg2's API
+        return not is_psycopg3
+    
+    def _copy_login_history(self, path):
+        """Export login history with COPY, which streams rows without per-row ORM work"""
+        qn = connection.ops.quote_name
+        # id, user_id and timestamp never contain backslashes, so COPY's text-format
+        # escaping leaves the JSON untouched
+        sql = (
+            "COPY (SELECT json_build_object('id', {id}, 'user_id', {user_id}, 'timestamp', {timestamp}) "
+            "FROM {table} ORDER BY {id}) TO STDOUT"
+        ).format(
+            id=qn('id'),
+            user_id=qn('user_id'),
+            timestamp=qn('timestamp'),
+            table=qn(LoginHistory._meta.db_table),
+        )
+        with self._open_output(path) as f, connection.cursor() as cursor:
+            writer = JSONArrayWriter(f)
+            cursor.copy_expert(sql, writer)
+            writer.finish()
+        return writer.count
+    
     def export_users(self):
-        users = User.objects.all()
-        user_data = []
+        rows = User.objects.values(
+            'id', 'username', 'email', 'role', 'is_active', 'date_joined'
+        ).iterator(chunk_size=2000)
+        path = self._output_path('exported_users.json')
+        count = self._stream_dump(path, rows)
         
-        for user in users:
-            user_data.append({
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'role': user.role,
-                'is_active': user.is_active,
-                'date_joined': user.date_joined
-            })
-        
-        with open('exported_users.json', 'w') as f:
-            json.dump(user_data, f, cls=DjangoJSONEncoder, indent=2)
-        
-        self.stdout.write(self.style.SUCCESS(f'Exported {len(user_data)} users to exported_users.json'))
+        self.stdout.write(self.style.SUCCESS(f'Exported {count} users to {path}'))
     
     def export_locations(self):
-        locations = Location.objects.all()
-        location_data = []
-        
-        for location in locations:
-            location_data.append({
-                'id': location.id,
-                'name': location.name,
-                'address': location.address
-            })
-        
-        with open('exported_locations.json', 'w') as f:
-            json.dump(location_data, f, cls=DjangoJSONEncoder, indent=2)
+        rows = Location.objects.values('id', 'name', 'address').iterator(chunk_size=2000)
+        path = self._output_path('exported_locations.json')
+        count = self._stream_dump(path, rows)
         
-        self.stdout.write(self.style.SUCCESS(f'Exported {len(location_data)} locations to exported_locations.json'))
+        self.stdout.write(self.style.SUCCESS(f'Exported {count} locations to {path}'))
     
     def export_cars(self):
-        cars = Car.objects.all()
-        car_data = []
-        
-        for car in cars:
-            car_data.append({
-                'id': car.id,
-                'make': car.make,
-                'model': car.model,
-                'year': car.year,
-                'location_id': car.location.id,
-                'status': car.status,
-                'car_id': car.car_id
-            })
-        
-        with open('exported_cars.json', 'w') as f:
-            json.dump(car_data, f, cls=DjangoJSONEncoder, indent=2)
-        
-        self.stdout.write(self.style.SUCCESS(f'Exported {len(car_data)} cars to exported_cars.json'))
+        # location_id is read straight from the FK column, no join or per-row lookup
+        rows = Car.objects.values(
+            'id', 'make', 'model', 'year', 'location_id', 'status', 'car_id'
+        ).iterator(chunk_size=2000)
+        path = self._output_path('exported_cars.json')
+        count = self._stream_dump(path, rows)
+        
+        self.stdout.write(self.style.SUCCESS(f'Exported {count} cars to {path}'))
     
     def export_rentals(self):
-        rentals = Rental.objects.all()
-        rental_data = []
-        
-        for rental in rentals:
-            rental_data.append({
-                'id': rental.id,
-                'user_id': rental.user.id,
-                'car_id': rental.car.id,
-                'start_date': rental.start_date,
-                'end_date': rental.end_date,
-                'status': rental.status
-            })
+        rows = Rental.objects.values(
+            'id', 'user_id', 'car_id', 'start_date', 'end_date', 'status'
+        ).iterator(chunk_size=2000)
+        path = self._output_path('exported_rentals.json')
+        count = self._stream_dump(path, rows)
         
-        with open('exported_rentals.json', 'w') as f:
-            json.dump(rental_data, f, cls=DjangoJSONEncoder, indent=2)
-        
-        self.stdout.write(self.style.SUCCESS(f'Exported {len(rental_data)} rentals to exported_rentals.json'))
+        self.stdout.write(self.style.SUCCESS(f'Exported {count} rentals to {path}'))
     
     def export_login_history(self):
-        history = LoginHistory.objects.all()
-        history_data = []
-        
-        for entry in history:
-            history_data.append({
-                'id': entry.id,
-                'user_id': entry.user.id,
-                'timestamp': entry.timestamp
-            })
-        
-        with open('exported_login_history.json', 'w') as f:
-            json.dump(history_data, f, cls=DjangoJSONEncoder, indent=2)
-        
-        self.stdout.write(self.style.SUCCESS(f'Exported {len(history_data)} login history entries to exported_login_history.json'))
\ No newline at end of file
+        path = self._output_path('exported_login_history.json')
+        if self._can_copy():
+            count = self._copy_login_history(path)
+        else:
+            rows = LoginHistory.objects.values('id', 'user_id', 'timestamp').iterator(chunk_size=2000)
+            count = self._stream_dump(path, rows)
+        
+        self.stdout.write(self.style.SUCCESS(f'Exported {count} login history entries to {path}'))
\ No newline at end of file
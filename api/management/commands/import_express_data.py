@@ -1,14 +1,93 @@
 from django.core.management.base import BaseCommand
 import json
-from django.db import transaction
+from django.db import DatabaseError, connection, transaction
+from django.contrib.auth.hashers import make_password
 from authentication.models import User, LoginHistory
 from cars.models import Car
 from locations.models import Location
 from rentals.models import Rental
 from django.utils import timezone
-from datetime import datetime
+from django.utils.dateparse import parse_datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import os
 
+from api.cache import DASHBOARD_ACTIVITY, DASHBOARD_STATS, bump_dashboard_version
+from api.optional import bulk_insert_models, ijson, orjson
+
+# Raised while reading a dump: a missing or unreadable file, or malformed JSON
+DUMP_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Rows read from a dump and written to the database at a time
+BATCH_SIZE = 1000
+
+# From this many rows, login history is loaded with PostgreSQL COPY when django-bulk-load is installed
+COPY_THRESHOLD = 10000
+
+# Below this many passwords the process pool costs more than it saves
+PARALLEL_HASH_THRESHOLD = 8
+
+
+def hash_passwords(passwords):
+    """Hash a list of raw passwords, spreading the work over all cores for large lists"""
+    if len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [make_password(password) for password in passwords]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(make_password, passwords, chunksize=16))
+
+
+def parse_id(value):
+    """Return a primary key from a dump as an int, or None if it isn't numeric
+
+    Dumps may carry ids as numbers or as numeric strings ("2"); both refer to the same row.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 string into an aware datetime, or return None if it isn't valid
+
+    Dumps repeat the same timestamps a lot (login history especially), so results are cached.
+    """
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        # Naive values are stored in the default timezone; make that explicit so
+        # they compare equal to the aware datetimes read back from the database
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def iter_json_batches(file_path, size=BATCH_SIZE):
+    """Yield the objects of a JSON array dump in lists of up to size items
+
+    With ijson installed the file is parsed incrementally, so memory is bounded by
+    the batch size and the first batch is written before the file is fully read.
+    """
+    with open(file_path, 'rb') as f:
+        if ijson is not None:
+            items = ijson.items(f, 'item', use_float=True)
+        elif orjson is not None:
+            items = orjson.loads(f.read())
+        else:
+            items = json.load(f)
+        
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
 class Command(BaseCommand):
     help = 'Import data from Express.js JSON dumps into Django database'
 
@@ -21,6 +100,9 @@ class Command(BaseCommand):
         parser.add_argument('--all', action='store_true', help='Import all data')
 
     def handle(self, *args, **kwargs):
+        # Per-row progress is only reported with -v 2 or higher
+        self.verbosity = int(kwargs.get('verbosity', 1))
+        self.imported_rows = 0
         self.stdout.write(self.style.SUCCESS('Starting data import...'))
         
         users_file = kwargs.get('users_file')
@@ -56,219 +138,389 @@ class Command(BaseCommand):
         elif import_all and os.path.exists('express_login_history.json'):
             self.import_login_history('express_login_history.json')
         
+        # The batches are written with bulk_create/bulk_update, which send no model
+        # signals, so the cached dashboard is invalidated here once instead
+        if self.imported_rows:
+            bump_dashboard_version(DASHBOARD_STATS, DASHBOARD_ACTIVITY)
+        
         self.stdout.write(self.style.SUCCESS('Data import completed!'))
     
-    @transaction.atomic
     def import_users(self, file_path):
-        with open(file_path, 'r') as f:
-            users_data = json.load(f)
+        self._import_batches(file_path, self._import_user_batch, 'users')
+    
+    def import_locations(self, file_path):
+        self._import_batches(file_path, self._import_location_batch, 'locations')
+    
+    def import_cars(self, file_path):
+        self._import_batches(file_path, self._import_car_batch, 'cars')
+    
+    def import_rentals(self, file_path):
+        self._import_batches(file_path, self._import_rental_batch, 'rentals')
+    
+    def import_login_history(self, file_path):
+        # COPY only pays off for large batches, so read bigger ones when it's available
+        use_copy = bulk_insert_models is not None and connection.vendor == 'postgresql'
+        self._import_batches(
+            file_path,
+            self._import_login_history_batch,
+            'login history entries',
+            batch_size=COPY_THRESHOLD if use_copy else BATCH_SIZE,
+        )
+    
+    def _import_batches(self, file_path, import_batch, label, batch_size=BATCH_SIZE):
+        """Stream a dump through import_batch in chunks, each in its own transaction
+
+        A batch that fails is rolled back and reported by its row range; the batches
+        before and after it are still imported.
+        """
+        imported_count = created_count = updated_count = 0
+        first_row = 1
+        try:
+            for rows in iter_json_batches(file_path, batch_size):
+                last_row = first_row + len(rows) - 1
+                # The batch importers read fields with .get(); anything but an object is
+                # reported and left out rather than failing the batch
+                if not all(isinstance(row, dict) for row in rows):
+                    for row_number, row in enumerate(rows, first_row):
+                        if not isinstance(row, dict):
+                            self.stdout.write(self.style.ERROR(
+                                f"Row {row_number} of {file_path} is not an object, skipping..."
+                            ))
+                    rows = [row for row in rows if isinstance(row, dict)]
+                try:
+                    with transaction.atomic():
+                        imported, created, updated = import_batch(rows)
+                except (DatabaseError, ValueError, TypeError) as e:
+                    self.stdout.write(self.style.ERROR(
+                        f"Error importing {label} (rows {first_row}-{last_row} of {file_path}): {str(e)}"
+                    ))
+                else:
+                    imported_count += imported
+                    created_count += created
+                    updated_count += updated
+                first_row = last_row + 1
+        except DUMP_ERRORS as e:
+            self.stdout.write(self.style.ERROR(f"Error reading {label} from {file_path}: {str(e)}"))
+        
+        self.imported_rows += imported_count
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} {label} ({created_count} created, {updated_count} updated)"))
+    
+    def _import_user_batch(self, users_data):
+        # Bound once per batch; these are called for every row below
+        write = self.stdout.write
+        success, warning, error = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+        verbose = self.verbosity >= 2
         
-        imported_count = 0
+        valid_users = []
         for user_data in users_data:
-            try:
-                # Check if user already exists
-                if User.objects.filter(username=user_data['username']).exists():
-                    user = User.objects.get(username=user_data['username'])
-                    self.stdout.write(self.style.WARNING(f"User {user_data['username']} already exists, updating..."))
-                    
-                    # Update user data
-                    user.email = user_data.get('email', '')
-                    user.role = user_data.get('role', 'user')
-                    user.save()
-                else:
-                    # Create new user
-                    user = User.objects.create_user(
-                        username=user_data['username'],
-                        email=user_data.get('email', ''),
-                        password=user_data.get('password', 'password'),  # Set a default password
-                        role=user_data.get('role', 'user'),
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Created user: {user_data['username']}"))
-                imported_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error importing user {user_data.get('username')}: {str(e)}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} users"))
+            if not user_data.get('username') or not user_data.get('email'):
+                write(error(f"User {user_data.get('username')} is missing a username or email, skipping..."))
+                continue
+            valid_users.append(user_data)
+        
+        # One query to find which usernames are already in the database
+        existing = User.objects.in_bulk([d['username'] for d in valid_users], field_name='username')
+        
+        # Email is unique too, so look up who already owns each address; a row claiming
+        # another user's email is reported and skipped instead of failing the batch
+        emails = {User.objects.normalize_email(d['email']) for d in valid_users}
+        email_owners = dict(User.objects.filter(email__in=emails).values_list('email', 'username'))
+        
+        to_create, passwords, to_update = [], [], {}
+        created_count = updated_count = 0
+        for user_data in valid_users:
+            username = user_data['username']
+            email = User.objects.normalize_email(user_data['email'])
+            owner = email_owners.setdefault(email, username)
+            if owner != username:
+                write(error(f"Email {email} is already used by user {owner}, skipping user {username}..."))
+                continue
+            
+            user = existing.get(username)
+            if user is None:
+                user = User(
+                    username=username,
+                    email=email,
+                    role=user_data.get('role', 'user'),
+                )
+                existing[username] = user
+                to_create.append(user)
+                passwords.append(user_data.get('password'))
+                created_count += 1
+                if verbose:
+                    write(success(f"Created user: {username}"))
+            else:
+                if verbose:
+                    write(warning(f"User {username} already exists, updating..."))
+                updated_count += 1
+                user.email = email
+                user.role = user_data.get('role', 'user')
+                if user.pk is not None:
+                    to_update[user.pk] = user
+        
+        # Users without a password all get the same default, so it is hashed only once
+        default_hash = make_password('password') if None in passwords else None
+        custom_users = [(user, password) for user, password in zip(to_create, passwords) if password is not None]
+        custom_hashes = hash_passwords([password for _, password in custom_users])
+        for user in to_create:
+            user.password = default_hash
+        for (user, _), password_hash in zip(custom_users, custom_hashes):
+            user.password = password_hash
+        
+        User.objects.bulk_update(to_update.values(), ['email', 'role'], batch_size=BATCH_SIZE)
+        # A username inserted since the lookup above is updated instead of failing the batch
+        User.objects.bulk_create(
+            to_create,
+            update_conflicts=True,
+            unique_fields=['username'],
+            update_fields=['email', 'role'],
+            batch_size=BATCH_SIZE,
+        )
+        return created_count + updated_count, created_count, updated_count
     
-    @transaction.atomic
-    def import_locations(self, file_path):
-        with open(file_path, 'r') as f:
-            locations_data = json.load(f)
+    def _import_location_batch(self, locations_data):
+        write = self.stdout.write
+        success, warning, error = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+        verbose = self.verbosity >= 2
         
-        imported_count = 0
+        valid_locations = []
         for location_data in locations_data:
-            try:
-                # Check if location already exists
-                if Location.objects.filter(name=location_data['name']).exists():
-                    location = Location.objects.get(name=location_data['name'])
-                    self.stdout.write(self.style.WARNING(f"Location {location_data['name']} already exists, updating..."))
-                    
-                    # Update location data
-                    location.address = location_data.get('address', '')
-                    location.save()
-                else:
-                    # Create new location
-                    location = Location.objects.create(
-                        name=location_data['name'],
-                        address=location_data.get('address', '')
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Created location: {location_data['name']}"))
-                imported_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error importing location {location_data.get('name')}: {str(e)}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} locations"))
+            if not location_data.get('name'):
+                write(error("Location is missing a name, skipping..."))
+                continue
+            valid_locations.append(location_data)
+        
+        # Location names are not unique in the schema, so in_bulk() can't be used here
+        existing = {
+            location.name: location
+            for location in Location.objects.filter(name__in=[d['name'] for d in valid_locations])
+        }
+        
+        to_create, to_update = [], {}
+        created_count = updated_count = 0
+        for location_data in valid_locations:
+            name = location_data['name']
+            location = existing.get(name)
+            if location is None:
+                location = Location(name=name, address=location_data.get('address', ''))
+                existing[name] = location
+                to_create.append(location)
+                created_count += 1
+                if verbose:
+                    write(success(f"Created location: {name}"))
+            else:
+                if verbose:
+                    write(warning(f"Location {name} already exists, updating..."))
+                updated_count += 1
+                location.address = location_data.get('address', '')
+                if location.pk is not None:
+                    to_update[location.pk] = location
+        
+        Location.objects.bulk_update(to_update.values(), ['address'], batch_size=BATCH_SIZE)
+        Location.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        return len(valid_locations), created_count, updated_count
     
-    @transaction.atomic
-    def import_cars(self, file_path):
-        with open(file_path, 'r') as f:
-            cars_data = json.load(f)
+    def _import_car_batch(self, cars_data):
+        write = self.stdout.write
+        success, warning, error = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+        verbose = self.verbosity >= 2
         
-        imported_count = 0
+        # Only the locations this batch refers to are looked up
+        location_ids = {parse_id(d.get('locationId')) for d in cars_data}
+        valid_location_ids = set(
+            Location.objects.filter(id__in=location_ids - {None}).values_list('id', flat=True)
+        )
+        
+        valid_cars = []
         for car_data in cars_data:
-            try:
-                # Get location
-                location_id = car_data.get('locationId')
-                if not location_id:
-                    self.stdout.write(self.style.ERROR(f"Car {car_data.get('carId')} has no location ID, skipping..."))
-                    continue
-                
-                try:
-                    location = Location.objects.get(id=location_id)
-                except Location.DoesNotExist:
-                    self.stdout.write(self.style.ERROR(f"Location ID {location_id} not found, skipping car {car_data.get('carId')}..."))
-                    continue
-                
-                # Check if car already exists
-                if Car.objects.filter(car_id=car_data['carId']).exists():
-                    car = Car.objects.get(car_id=car_data['carId'])
-                    self.stdout.write(self.style.WARNING(f"Car {car_data['carId']} already exists, updating..."))
-                    
-                    # Update car data
-                    car.make = car_data.get('make', '')
-                    car.model = car_data.get('model', '')
-                    car.year = car_data.get('year', 2023)
-                    car.location = location
-                    car.status = car_data.get('status', 'available')
-                    car.save()
-                else:
-                    # Create new car
-                    car = Car.objects.create(
-                        make=car_data.get('make', ''),
-                        model=car_data.get('model', ''),
-                        year=car_data.get('year', 2023),
-                        location=location,
-                        status=car_data.get('status', 'available'),
-                        car_id=car_data['carId']
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Created car: {car_data['make']} {car_data['model']}"))
-                imported_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error importing car {car_data.get('carId')}: {str(e)}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} cars"))
+            # Get location
+            raw_location_id = car_data.get('locationId')
+            if not raw_location_id:
+                write(error(f"Car {car_data.get('carId')} has no location ID, skipping..."))
+                continue
+            
+            if not car_data.get('carId'):
+                write(error(f"Car {car_data.get('make')} {car_data.get('model')} has no car ID, skipping..."))
+                continue
+            
+            location_id = parse_id(raw_location_id)
+            if location_id is None:
+                write(error(f"Invalid location ID {raw_location_id}, skipping car {car_data.get('carId')}..."))
+                continue
+            
+            if location_id not in valid_location_ids:
+                write(error(f"Location ID {location_id} not found, skipping car {car_data.get('carId')}..."))
+                continue
+            
+            valid_cars.append((location_id, car_data))
+        
+        existing = Car.objects.in_bulk([d['carId'] for _, d in valid_cars], field_name='car_id')
+        
+        to_create, to_update = [], {}
+        created_count = updated_count = 0
+        for location_id, car_data in valid_cars:
+            car = existing.get(car_data['carId'])
+            if car is None:
+                car = Car(car_id=car_data['carId'])
+                existing[car.car_id] = car
+                to_create.append(car)
+                created_count += 1
+                if verbose:
+                    write(success(f"Created car: {car_data.get('make')} {car_data.get('model')}"))
+            else:
+                if verbose:
+                    write(warning(f"Car {car_data['carId']} already exists, updating..."))
+                updated_count += 1
+                if car.pk is not None:
+                    to_update[car.pk] = car
+            
+            car.make = car_data.get('make', '')
+            car.model = car_data.get('model', '')
+            car.year = car_data.get('year', 2023)
+            car.location_id = location_id
+            car.status = car_data.get('status', 'available')
+        
+        car_fields = ['make', 'model', 'year', 'location', 'status']
+        Car.objects.bulk_update(to_update.values(), car_fields, batch_size=BATCH_SIZE)
+        Car.objects.bulk_create(
+            to_create,
+            update_conflicts=True,
+            unique_fields=['car_id'],
+            update_fields=car_fields,
+            batch_size=BATCH_SIZE,
+        )
+        return len(valid_cars), created_count, updated_count
     
-    @transaction.atomic
-    def import_rentals(self, file_path):
-        with open(file_path, 'r') as f:
-            rentals_data = json.load(f)
+    def _import_rental_batch(self, rentals_data):
+        write = self.stdout.write
+        success, warning, error = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+        verbose = self.verbosity >= 2
+        
+        user_ids = {parse_id(d.get('userId')) for d in rentals_data}
+        car_ids = {parse_id(d.get('carId')) for d in rentals_data}
+        valid_user_ids = set(User.objects.filter(id__in=user_ids - {None}).values_list('id', flat=True))
+        valid_car_ids = set(Car.objects.filter(id__in=car_ids - {None}).values_list('id', flat=True))
         
-        imported_count = 0
+        valid_rentals = []
         for rental_data in rentals_data:
-            try:
-                # Get user and car
-                user_id = rental_data.get('userId')
-                car_id = rental_data.get('carId')
-                
-                if not user_id or not car_id:
-                    self.stdout.write(self.style.ERROR(f"Rental is missing user ID or car ID, skipping..."))
-                    continue
-                
-                try:
-                    user = User.objects.get(id=user_id)
-                except User.DoesNotExist:
-                    self.stdout.write(self.style.ERROR(f"User ID {user_id} not found, skipping rental..."))
-                    continue
-                
-                try:
-                    car = Car.objects.get(id=car_id)
-                except Car.DoesNotExist:
-                    self.stdout.write(self.style.ERROR(f"Car ID {car_id} not found, skipping rental..."))
-                    continue
-                
-                # Parse dates
-                start_date = self.parse_date(rental_data.get('startDate', timezone.now().isoformat()))
-                end_date = self.parse_date(rental_data.get('endDate', timezone.now().isoformat()))
-                
-                # Check if rental already exists
-                existing_rental = Rental.objects.filter(
-                    user=user,
-                    car=car,
+            # Get user and car
+            raw_user_id = rental_data.get('userId')
+            raw_car_id = rental_data.get('carId')
+            
+            if not raw_user_id or not raw_car_id:
+                write(error("Rental is missing user ID or car ID, skipping..."))
+                continue
+            
+            user_id = parse_id(raw_user_id)
+            car_id = parse_id(raw_car_id)
+            if user_id is None or car_id is None:
+                write(error(f"Invalid user ID {raw_user_id} or car ID {raw_car_id}, skipping rental..."))
+                continue
+            
+            if user_id not in valid_user_ids:
+                write(error(f"User ID {user_id} not found, skipping rental..."))
+                continue
+            
+            if car_id not in valid_car_ids:
+                write(error(f"Car ID {car_id} not found, skipping rental..."))
+                continue
+            
+            # Parse dates
+            start_date = self.parse_date(rental_data.get('startDate'))
+            end_date = self.parse_date(rental_data.get('endDate'))
+            
+            valid_rentals.append(((user_id, car_id, start_date, end_date), rental_data))
+        
+        # Rentals have no natural key, so match on (user, car, start, end) in Python.
+        # Only the candidate rows' key columns and ids are read; no model instances are built.
+        pairs = {(user_id, car_id) for (user_id, car_id, _, _), _ in valid_rentals}
+        existing_ids = {
+            (user_id, car_id, start_date, end_date): pk
+            for pk, user_id, car_id, start_date, end_date in Rental.objects.filter(
+                user_id__in={user_id for user_id, _ in pairs},
+                car_id__in={car_id for _, car_id in pairs},
+            ).values_list('id', 'user_id', 'car_id', 'start_date', 'end_date')
+        }
+        
+        to_create, to_update, seen = [], [], {}
+        created_count = updated_count = 0
+        for key, rental_data in valid_rentals:
+            rental = seen.get(key)
+            if rental is None and key not in existing_ids:
+                user_id, car_id, start_date, end_date = key
+                rental = Rental(
+                    user_id=user_id,
+                    car_id=car_id,
                     start_date=start_date,
-                    end_date=end_date
-                ).first()
-                
-                if existing_rental:
-                    self.stdout.write(self.style.WARNING(f"Similar rental already exists, updating..."))
-                    existing_rental.status = rental_data.get('status', 'active')
-                    existing_rental.save()
-                else:
-                    # Create new rental
-                    rental = Rental.objects.create(
-                        user=user,
-                        car=car,
-                        start_date=start_date,
-                        end_date=end_date,
-                        status=rental_data.get('status', 'active')
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Created rental: {user.username} - {car.make} {car.model}"))
-                imported_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error importing rental: {str(e)}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} rentals"))
+                    end_date=end_date,
+                )
+                to_create.append(rental)
+                created_count += 1
+                if verbose:
+                    write(success(f"Created rental: user {user_id} - car {car_id}"))
+            else:
+                if verbose:
+                    write(warning("Similar rental already exists, updating..."))
+                updated_count += 1
+                if rental is None:
+                    # Updating the status only needs the primary key
+                    rental = Rental(id=existing_ids[key])
+                    to_update.append(rental)
+            seen[key] = rental
+            
+            rental.status = rental_data.get('status', 'active')
+        
+        Rental.objects.bulk_update(to_update, ['status'], batch_size=BATCH_SIZE)
+        Rental.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        return len(valid_rentals), created_count, updated_count
     
-    @transaction.atomic
-    def import_login_history(self, file_path):
-        with open(file_path, 'r') as f:
-            history_data = json.load(f)
+    def _import_login_history_batch(self, history_data):
+        write = self.stdout.write
+        error = self.style.ERROR
         
-        imported_count = 0
+        user_ids = {parse_id(d.get('userId')) for d in history_data}
+        valid_user_ids = set(User.objects.filter(id__in=user_ids - {None}).values_list('id', flat=True))
+        
+        entries = []
         for entry_data in history_data:
-            try:
-                # Get user
-                user_id = entry_data.get('userId')
-                
-                if not user_id:
-                    self.stdout.write(self.style.ERROR(f"Login history entry is missing user ID, skipping..."))
-                    continue
-                
-                try:
-                    user = User.objects.get(id=user_id)
-                except User.DoesNotExist:
-                    self.stdout.write(self.style.ERROR(f"User ID {user_id} not found, skipping login history entry..."))
-                    continue
-                
-                # Parse timestamp
-                timestamp = self.parse_date(entry_data.get('timestamp', timezone.now().isoformat()))
-                
-                # Create new login history entry
-                LoginHistory.objects.create(
-                    user=user,
-                    timestamp=timestamp
-                )
-                self.stdout.write(self.style.SUCCESS(f"Created login history entry for user: {user.username}"))
-                imported_count += 1
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error importing login history entry: {str(e)}"))
+            # Get user
+            raw_user_id = entry_data.get('userId')
+            
+            if not raw_user_id:
+                write(error("Login history entry is missing user ID, skipping..."))
+                continue
+            
+            user_id = parse_id(raw_user_id)
+            if user_id is None:
+                write(error(f"Invalid user ID {raw_user_id}, skipping login history entry..."))
+                continue
+            
+            if user_id not in valid_user_ids:
+                write(error(f"User ID {user_id} not found, skipping login history entry..."))
+                continue
+            
+            # Parse timestamp
+            timestamp = self.parse_date(entry_data.get('timestamp'))
+            
+            entries.append(LoginHistory(user_id=user_id, timestamp=timestamp))
         
-        self.stdout.write(self.style.SUCCESS(f"Imported {imported_count} login history entries"))
+        if (
+            bulk_insert_models is not None
+            and connection.vendor == 'postgresql'
+            and len(entries) >= COPY_THRESHOLD
+        ):
+            bulk_insert_models(entries, ignore_conflicts=True)
+        else:
+            LoginHistory.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+        return len(entries), len(entries), 0
     
     def parse_date(self, date_str):
-        """Parse a date string to a datetime object"""
-        try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except ValueError:
+        """Parse a date string to a datetime object, defaulting to the current time"""
+        if not date_str:
+            return timezone.now()
+        parsed = parse_iso_datetime(date_str) if isinstance(date_str, str) else None
+        if parsed is None:
             # If we can't parse it, return current time
             self.stdout.write(self.style.WARNING(f"Could not parse date: {date_str}, using current time instead"))
-            return timezone.now()
\ No newline at end of file
+            return timezone.now()
+        return parsed
\ No newline at end of file
@@ -50,15 +50,14 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS('Created regular user'))
         
         # Create locations
-        locations = [
-            Location.objects.create(name='Downtown', address='123 Main St, Downtown'),
-            Location.objects.create(name='Airport', address='456 Airport Rd'),
-            Location.objects.create(name='Suburban', address='789 Oak Ave, Suburbia')
-        ]
+        locations = Location.objects.bulk_create([
+            Location(name='Downtown', address='123 Main St, Downtown'),
+            Location(name='Airport', address='456 Airport Rd'),
+            Location(name='Suburban', address='789 Oak Ave, Suburbia')
+        ])
         self.stdout.write(self.style.SUCCESS(f'Created {len(locations)} locations'))
         
         # Create cars
-        cars = []
         car_data = [
             {'make': 'Toyota', 'model': 'Camry', 'year': 2022, 'location': locations[0], 'car_id': 'CAR-001'},
             {'make': 'Honda', 'model': 'Civic', 'year': 2021, 'location': locations[0], 'car_id': 'CAR-002'},
@@ -68,32 +67,31 @@ class Command(BaseCommand):
             {'make': 'BMW', 'model': '3 Series', 'year': 2023, 'location': locations[2], 'car_id': 'CAR-006'},
         ]
         
-        for data in car_data:
-            car = Car.objects.create(**data)
-            cars.append(car)
+        cars = Car.objects.bulk_create([Car(**data) for data in car_data])
         
         self.stdout.write(self.style.SUCCESS(f'Created {len(cars)} cars'))
         
         # Create some rentals
         now = timezone.now()
         
-        # Active rental
-        Rental.objects.create(
-            user=user,
-            car=cars[0],
-            start_date=now - timedelta(days=1),
-            end_date=now + timedelta(days=3),
-            status='active'
-        )
-        
-        # Completed rental
-        Rental.objects.create(
-            user=user,
-            car=cars[1],
-            start_date=now - timedelta(days=10),
-            end_date=now - timedelta(days=5),
-            status='completed'
-        )
+        Rental.objects.bulk_create([
+            # Active rental
+            Rental(
+                user=user,
+                car=cars[0],
+                start_date=now - timedelta(days=1),
+                end_date=now + timedelta(days=3),
+                status='active'
+            ),
+            # Completed rental
+            Rental(
+                user=user,
+                car=cars[1],
+                start_date=now - timedelta(days=10),
+                end_date=now - timedelta(days=5),
+                status='completed'
+            ),
+        ])
         
         self.stdout.write(self.style.SUCCESS('Created sample rentals'))
         self.stdout.write(self.style.SUCCESS('Sample data initialization complete'))
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Optional speedups installed with the ``perf`` extra (``pip install -e '.[perf]'``)
+
+Each name is None when its package is not installed, and callers fall back to the
+standard library or plain ORM code path. The redis package from the same extra is
+not imported here; Django loads it itself when REDIS_URL is set.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from django_bulk_load import bulk_insert_models
+except ImportError:
+    bulk_insert_models = None
+
+try:
+    from django_querysets_single_query_fetch.service import QuerysetCountWrapper, QuerysetsSingleQueryFetch
+except ImportError:
+    QuerysetCountWrapper = QuerysetsSingleQueryFetch = None
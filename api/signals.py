@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import LoginHistory, User
+from cars.models import Car
+from rentals.models import Rental
+from .cache import DASHBOARD_ACTIVITY, DASHBOARD_STATS, bump_dashboard_version
+
+
+@receiver([post_save, post_delete], sender=Car)
+@receiver([post_save, post_delete], sender=Rental)
+def invalidate_dashboard(sender, **kwargs):
+    """Drop cached dashboard data when a car or rental changes; both feed every panel"""
+    bump_dashboard_version(DASHBOARD_STATS, DASHBOARD_ACTIVITY)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_count(sender, created=True, **kwargs):
+    """Drop cached stats when a user is added or removed
+
+    Saves of existing users (last_login on every login, profile edits) leave the
+    counts unchanged and keep the cache. post_delete sends no created flag, so the
+    default counts it as a change.
+    """
+    if created:
+        bump_dashboard_version(DASHBOARD_STATS)
+
+
+@receiver([post_save, post_delete], sender=LoginHistory)
+def invalidate_activity(sender, **kwargs):
+    """Drop the cached activity feed when login history changes"""
+    bump_dashboard_version(DASHBOARD_ACTIVITY)
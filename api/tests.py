@@ -1,3 +1,262 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from authentication.models import LoginHistory, User
+from cars.models import Car
+from locations.models import Location
+from rentals.models import Rental
+from .management.commands import export_data, import_express_data
+
+
+class ImportExpressDataTests(TestCase):
+    """Tests for the import_express_data management command"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(name='Downtown', address='1 Main St')
+        cls.user = User.objects.create_user('driver', 'driver@example.com', 'password')
+        cls.car = Car.objects.create(
+            car_id='CAR-1', make='Toyota', model='Camry', year=2022, location=cls.location,
+        )
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+
+    def write_dump(self, name, rows):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            json.dump(rows, f)
+        return path
+
+    def run_import(self, **files):
+        """Run the command with the given <kind>_file paths and return its output"""
+        out = StringIO()
+        call_command('import_express_data', stdout=out, **files)
+        return out.getvalue()
+
+    def test_users_created_then_updated(self):
+        path = self.write_dump('users.json', [
+            {'username': 'alice', 'email': 'alice@example.com'},
+            {'username': 'bob', 'email': 'bob@example.com', 'role': 'admin'},
+        ])
+        output = self.run_import(users_file=path)
+        self.assertIn('Imported 2 users (2 created, 0 updated)', output)
+
+        path = self.write_dump('users.json', [
+            {'username': 'alice', 'email': 'alice@example.com', 'role': 'admin'},
+            {'username': 'bob', 'email': 'bob@example.com'},
+        ])
+        output = self.run_import(users_file=path)
+        self.assertIn('Imported 2 users (0 created, 2 updated)', output)
+        self.assertEqual(User.objects.get(username='alice').role, User.ROLE_ADMIN)
+        self.assertEqual(User.objects.get(username='bob').role, User.ROLE_USER)
+        self.assertTrue(User.objects.get(username='alice').check_password('password'))
+
+    def test_duplicate_username_in_one_file(self):
+        path = self.write_dump('users.json', [
+            {'username': 'carol', 'email': 'carol@example.com'},
+            {'username': 'carol', 'email': 'carol@example.org', 'role': 'admin'},
+        ])
+        output = self.run_import(users_file=path)
+        self.assertIn('Imported 2 users (1 created, 1 updated)', output)
+        carol = User.objects.get(username='carol')
+        self.assertEqual(carol.email, 'carol@example.org')
+        self.assertEqual(carol.role, User.ROLE_ADMIN)
+
+    def test_email_owned_by_another_user_is_skipped(self):
+        path = self.write_dump('users.json', [
+            {'username': 'dave', 'email': 'dave@example.com'},
+            {'username': 'impostor', 'email': 'driver@example.com'},
+            {'username': 'erin', 'email': 'erin@example.com'},
+        ])
+        output = self.run_import(users_file=path)
+        self.assertIn('Email driver@example.com is already used by user driver, skipping user impostor', output)
+        self.assertIn('Imported 2 users (2 created, 0 updated)', output)
+        self.assertEqual(User.objects.filter(username__in=['dave', 'erin']).count(), 2)
+        self.assertFalse(User.objects.filter(username='impostor').exists())
+
+    def test_reimporting_rentals_updates_instead_of_duplicating(self):
+        path = self.write_dump('rentals.json', [
+            {'userId': self.user.id, 'carId': self.car.id,
+             'startDate': '2024-01-01T10:00:00Z', 'endDate': '2024-01-05T10:00:00Z'},
+            {'userId': self.user.id, 'carId': self.car.id,
+             'startDate': '2024-02-01T10:00:00Z', 'endDate': '2024-02-03T10:00:00Z', 'status': 'completed'},
+        ])
+        output = self.run_import(rentals_file=path)
+        self.assertIn('Imported 2 rentals (2 created, 0 updated)', output)
+
+        output = self.run_import(rentals_file=path)
+        self.assertIn('Imported 2 rentals (0 created, 2 updated)', output)
+        self.assertEqual(Rental.objects.count(), 2)
+        self.assertEqual(Rental.objects.filter(status='completed').count(), 1)
+
+    def test_missing_or_unknown_foreign_keys_are_skipped(self):
+        cars_path = self.write_dump('cars.json', [
+            {'carId': 'CAR-2', 'make': 'Honda', 'model': 'Civic', 'year': 2021},
+            {'carId': 'CAR-3', 'make': 'Ford', 'model': 'Focus', 'year': 2020, 'locationId': 999999},
+            {'carId': 'CAR-4', 'make': 'Kia', 'model': 'Rio', 'year': 2023, 'locationId': self.location.id},
+        ])
+        rentals_path = self.write_dump('rentals.json', [
+            {'carId': self.car.id},
+            {'userId': 999999, 'carId': self.car.id},
+            {'userId': self.user.id, 'carId': 999999},
+        ])
+        output = self.run_import(cars_file=cars_path, rentals_file=rentals_path)
+        self.assertIn('Car CAR-2 has no location ID', output)
+        self.assertIn('Location ID 999999 not found, skipping car CAR-3', output)
+        self.assertIn('Imported 1 cars (1 created, 0 updated)', output)
+        self.assertIn('Rental is missing user ID or car ID', output)
+        self.assertIn('User ID 999999 not found', output)
+        self.assertIn('Car ID 999999 not found', output)
+        self.assertIn('Imported 0 rentals', output)
+        self.assertEqual(set(Car.objects.values_list('car_id', flat=True)), {'CAR-1', 'CAR-4'})
+        self.assertFalse(Rental.objects.exists())
+
+    def test_non_object_rows_are_skipped(self):
+        path = self.write_dump('login_history.json', [
+            {'userId': self.user.id, 'timestamp': '2024-01-01T10:00:00Z'},
+            5,
+            'text',
+            {'userId': self.user.id, 'timestamp': '2024-01-02T10:00:00Z'},
+        ])
+        output = self.run_import(login_history_file=path)
+        self.assertIn(f'Row 2 of {path} is not an object, skipping', output)
+        self.assertIn(f'Row 3 of {path} is not an object, skipping', output)
+        self.assertIn('Imported 2 login history entries', output)
+        self.assertEqual(LoginHistory.objects.filter(user=self.user).count(), 2)
+
+    def test_numeric_string_ids_are_accepted(self):
+        cars_path = self.write_dump('cars.json', [
+            {'carId': 'CAR-5', 'make': 'Mazda', 'model': '3', 'year': 2022, 'locationId': str(self.location.id)},
+            {'carId': 'CAR-6', 'make': 'Seat', 'model': 'Ibiza', 'year': 2019, 'locationId': 'abc'},
+        ])
+        rentals_path = self.write_dump('rentals.json', [
+            {'userId': str(self.user.id), 'carId': str(self.car.id),
+             'startDate': '2024-03-01T10:00:00Z', 'endDate': '2024-03-02T10:00:00Z'},
+            {'userId': self.user.id, 'carId': self.car.id,
+             'startDate': '2024-03-01T10:00:00Z', 'endDate': '2024-03-02T10:00:00Z'},
+        ])
+        output = self.run_import(cars_file=cars_path, rentals_file=rentals_path)
+        self.assertIn('Invalid location ID abc, skipping car CAR-6', output)
+        self.assertIn('Imported 1 cars (1 created, 0 updated)', output)
+        self.assertEqual(Car.objects.get(car_id='CAR-5').location, self.location)
+        # "1" and 1 name the same rental, so the second row updates the first
+        self.assertIn('Imported 2 rentals (1 created, 1 updated)', output)
+        self.assertEqual(Rental.objects.count(), 1)
+
+
+class DashboardCacheTests(TestCase):
+    """The dashboard payloads are cached until a write they report on bumps their version
+
+    Queryset update() sends no signals, so it is used to change the data behind the
+    cache's back; the payload only reflects such a change once something bumps the version.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(name='Downtown', address='1 Main St')
+        cls.user = User.objects.create_user('viewer', 'viewer@example.com', 'password')
+        cls.car = Car.objects.create(
+            car_id='CAR-1', make='Toyota', model='Camry', year=2022, location=cls.location,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_stats(self):
+        return self.client.get('/api/dashboard/stats/').json()
+
+    def get_activity(self):
+        return self.client.get('/api/dashboard/activity/').json()
+
+    def test_stats_are_cached(self):
+        self.assertEqual(self.get_stats()['availableCars'], 1)
+        Car.objects.filter(pk=self.car.pk).update(status='maintenance')
+        self.assertEqual(self.get_stats()['availableCars'], 1)
+
+    def test_car_save_refreshes_stats(self):
+        self.assertEqual(self.get_stats()['availableCars'], 1)
+        self.car.status = 'maintenance'
+        self.car.save()
+        stats = self.get_stats()
+        self.assertEqual(stats['availableCars'], 0)
+        self.assertEqual(stats['maintenanceCars'], 1)
+
+    def test_rental_save_refreshes_stats_and_activity(self):
+        self.assertEqual(self.get_stats()['rentals'], 0)
+        self.assertEqual(self.get_activity(), [])
+        Rental.objects.create(
+            user=self.user, car=self.car,
+            start_date=timezone.now(), end_date=timezone.now(),
+        )
+        self.assertEqual(self.get_stats()['rentals'], 1)
+        self.assertEqual([a['type'] for a in self.get_activity()], ['rental'])
+
+    def test_login_refreshes_activity_but_keeps_stats(self):
+        self.assertEqual(self.get_stats()['availableCars'], 1)
+        self.assertEqual(self.get_activity(), [])
+        Car.objects.filter(pk=self.car.pk).update(status='maintenance')
+
+        # What a login writes: the user's last_login and a login history row
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=['last_login'])
+        LoginHistory.objects.create(user=self.user)
+
+        self.assertEqual(self.get_stats()['availableCars'], 1)
+        self.assertEqual([a['type'] for a in self.get_activity()], ['login'])
+
+    def test_new_user_refreshes_stats(self):
+        self.assertEqual(self.get_stats()['users'], 1)
+        User.objects.create_user('newcomer', 'newcomer@example.com', 'password')
+        self.assertEqual(self.get_stats()['users'], 2)
+
+    def test_import_refreshes_dashboard(self):
+        self.assertEqual(self.get_stats()['cars'], 1)
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump([{'carId': 'CAR-2', 'make': 'Kia', 'model': 'Rio', 'year': 2023,
+                        'locationId': self.location.id}], f)
+        self.addCleanup(os.remove, f.name)
+        call_command('import_express_data', cars_file=f.name, stdout=StringIO())
+        self.assertEqual(self.get_stats()['cars'], 2)
+
+class OptionalDependencyTests(SimpleTestCase):
+    """The perf extra's code paths and their fallbacks must produce the same results"""
+
+    def test_dump_parsers_agree(self):
+        rows = [{'id': i, 'name': f'row {i}', 'price': 1.5 * i} for i in range(5)]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(rows, f)
+        self.addCleanup(os.remove, f.name)
+
+        parsers = {
+            'ijson': {'orjson': None},
+            'orjson': {'ijson': None},
+            'json': {'ijson': None, 'orjson': None},
+        }
+        for name, disabled in parsers.items():
+            with self.subTest(parser=name):
+                if name != 'json' and getattr(import_express_data, name) is None:
+                    self.skipTest(f'{name} is not installed')
+                with mock.patch.multiple(import_express_data, **disabled):
+                    batches = list(import_express_data.iter_json_batches(f.name, size=2))
+                self.assertEqual(batches, [rows[0:2], rows[2:4], rows[4:5]])
+
+    def test_export_rows_match_without_orjson(self):
+        row = {'id': 1, 'timestamp': datetime(2024, 1, 1, 10, 0, tzinfo=dt_timezone.utc), 'name': 'Camry'}
+        with mock.patch.object(export_data, 'orjson', None):
+            fallback = export_data.dumps_row(row)
+        self.assertEqual(json.loads(fallback), {'id': 1, 'timestamp': '2024-01-01T10:00:00Z', 'name': 'Camry'})
+        if export_data.orjson is not None:
+            self.assertEqual(json.loads(export_data.dumps_row(row)), json.loads(fallback))
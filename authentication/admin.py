@@ -23,6 +23,7 @@ class UserAdmin(BaseUserAdmin):
 
 class LoginHistoryAdmin(admin.ModelAdmin):
     list_display = ('user', 'timestamp')
+    list_select_related = ('user',)
     list_filter = ('user', 'timestamp')
     search_fields = ('user__username',)
     ordering = ('-timestamp',)
@@ -31,13 +31,15 @@ class UserManager(BaseUserManager):
         return user
 
 class User(AbstractUser):
+    ROLE_ADMIN = 'admin'
+    ROLE_USER = 'user'
     ROLE_CHOICES = [
-        ('admin', 'Admin'),
-        ('user', 'User'),
+        (ROLE_ADMIN, 'Admin'),
+        (ROLE_USER, 'User'),
     ]
     
     email = models.EmailField(max_length=255, unique=True)
-    role = models.CharField(max_length=5, choices=ROLE_CHOICES, default='user')
+    role = models.CharField(max_length=5, choices=ROLE_CHOICES, default=ROLE_USER)
     
     objects = UserManager()
     
@@ -50,6 +52,9 @@ class LoginHistory(models.Model):
 
     class Meta:
         verbose_name_plural = 'Login Histories'
+        indexes = [
+            models.Index(fields=['-timestamp']),
+        ]
         
     def __str__(self):
         return f"{self.user.username} - {self.timestamp}"
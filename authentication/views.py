@@ -2,9 +2,39 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.contrib.auth import authenticate, login, logout
+from django.db import close_old_connections, transaction
+from concurrent.futures import ThreadPoolExecutor
+import logging
 from .models import User, LoginHistory
 from .serializers import UserSerializer, UserCreateSerializer, LoginHistorySerializer
 
+logger = logging.getLogger(__name__)
+
+# Login history is bookkeeping, so it is written off the request thread and the login
+# response does not wait on the INSERT. Work still queued when the process exits
+# normally is drained by the executor's own exit hook before the interpreter stops.
+login_history_executor = ThreadPoolExecutor(max_workers=1)
+
+def record_login(user_id):
+    """Insert a login history row from the background worker thread"""
+    close_old_connections()
+    try:
+        LoginHistory.objects.create(user_id=user_id)
+    finally:
+        close_old_connections()
+
+def log_failed_login_record(future):
+    """Done callback for record_login; the future is not awaited, so failures are logged here"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Failed to record login history", exc_info=exc)
+
+def submit_login_record(user_id):
+    """Queue record_login on the worker once the surrounding transaction commits"""
+    transaction.on_commit(
+        lambda: login_history_executor.submit(record_login, user_id).add_done_callback(log_failed_login_record)
+    )
+
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow admins to edit, but everyone can read
@@ -14,8 +44,10 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         
-        # Write permissions are only allowed to admin users
-        return request.user.is_authenticated and request.user.role == 'admin'
+        # Write permissions are only allowed to admin users; superusers pass without
+        # the role comparison
+        user = request.user
+        return user.is_authenticated and (user.is_superuser or user.role == User.ROLE_ADMIN)
 
 class UserViewSet(viewsets.ModelViewSet):
     """
@@ -44,7 +76,7 @@ class LoginHistoryViewSet(viewsets.ReadOnlyModelViewSet):
         """
         user = self.request.user
         if user.is_authenticated:
-            if user.role == 'admin':
+            if user.role == User.ROLE_ADMIN:
                 return LoginHistory.objects.all()
             return LoginHistory.objects.filter(user=user)
         return LoginHistory.objects.none()
@@ -68,7 +100,7 @@ class LoginView(APIView):
         if user:
             login(request, user)
             # Record login history
-            LoginHistory.objects.create(user=user)
+            submit_login_record(user.id)
             serializer = UserSerializer(user)
             return Response(serializer.data)
         
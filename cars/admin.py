@@ -3,6 +3,7 @@ from .models import Car
 
 class CarAdmin(admin.ModelAdmin):
     list_display = ('car_id', 'make', 'model', 'year', 'location', 'status')
+    list_select_related = ('location',)
     list_filter = ('status', 'make', 'year', 'location')
     search_fields = ('car_id', 'make', 'model')
     ordering = ('car_id',)
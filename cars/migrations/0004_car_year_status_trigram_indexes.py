@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:25
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0003_car_trigram_indexes'),
+        ('locations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='car',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('year', output_field=models.TextField())), name='gin_trgm_ops'), name='cars_car_year_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('status'), name='gin_trgm_ops'), name='cars_car_status_trgm_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from locations.models import Location
 
 class Car(models.Model):
@@ -12,8 +14,24 @@ class Car(models.Model):
     model = models.CharField(max_length=100)
     year = models.IntegerField()
     location = models.ForeignKey(Location, on_delete=models.CASCADE, related_name='cars')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='available')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='available', db_index=True)
     car_id = models.CharField(max_length=20, unique=True)
     
+    class Meta:
+        # The API's search filter runs icontains, which PostgreSQL evaluates as
+        # UPPER(col::text) LIKE UPPER('%term%'); trigram indexes on the same expressions
+        # let those searches use an index instead of scanning the table. The search ORs
+        # every field, so each one needs an index, the integer year included.
+        indexes = [
+            GinIndex(OpClass(Upper('make'), name='gin_trgm_ops'), name='cars_car_make_trgm_idx'),
+            GinIndex(OpClass(Upper('model'), name='gin_trgm_ops'), name='cars_car_model_trgm_idx'),
+            GinIndex(OpClass(Upper('car_id'), name='gin_trgm_ops'), name='cars_car_car_id_trgm_idx'),
+            GinIndex(
+                OpClass(Upper(Cast('year', output_field=models.TextField())), name='gin_trgm_ops'),
+                name='cars_car_year_trgm_idx',
+            ),
+            GinIndex(OpClass(Upper('status'), name='gin_trgm_ops'), name='cars_car_status_trgm_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.make} {self.model} ({self.year}) - {self.car_id}"
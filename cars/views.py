@@ -10,10 +10,12 @@ class CarViewSet(viewsets.ModelViewSet):
     """
     API endpoint that allows cars to be viewed or edited.
     """
-    queryset = Car.objects.all()
+    queryset = Car.objects.select_related('location').all()
     serializer_class = CarSerializer
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    # Each field is backed by a trigram index (see Car.Meta.indexes); an unindexed field
+    # in this OR would force a sequential scan
     search_fields = ['make', 'model', 'year', 'car_id', 'status']
     ordering_fields = ['make', 'model', 'year', 'status']
     
@@ -22,6 +24,9 @@ class CarViewSet(viewsets.ModelViewSet):
         """
         Return a list of all available cars.
         """
-        cars = Car.objects.filter(status='available')
+        cars = Car.objects.select_related('location').filter(status='available').order_by('car_id')
+        page = self.paginate_queryset(cars)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
         serializer = self.get_serializer(cars, many=True)
         return Response(serializer.data)
\ No newline at end of file
@@ -2,6 +2,18 @@ from django.db import models
 from authentication.models import User
 from cars.models import Car
 
+def overlapping_rental_exists(car_id, start_date, end_date, exclude_rental_id=None):
+    """Check whether an active rental of the car overlaps the given date range"""
+    overlapping_rentals = Rental.objects.filter(
+        car_id=car_id,
+        status='active',
+        start_date__lt=end_date,
+        end_date__gt=start_date,
+    )
+    if exclude_rental_id:
+        overlapping_rentals = overlapping_rentals.exclude(id=exclude_rental_id)
+    return overlapping_rentals.exists()
+
 class Rental(models.Model):
     STATUS_CHOICES = [
         ('active', 'Active'),
@@ -20,19 +32,14 @@ class Rental(models.Model):
     
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['-start_date']),
+            models.Index(fields=['status', 'car', 'start_date', 'end_date']),
+            models.Index(fields=['user', 'status']),
+        ]
         
     def is_car_available(self, exclude_rental_id=None):
         """Check if the car is available for the given date range"""
-        from django.db.models import Q
-        
-        overlapping_rentals = Rental.objects.filter(
-            Q(car=self.car),
-            Q(status='active'),
-            Q(start_date__lt=self.end_date) & Q(end_date__gt=self.start_date)
+        return not overlapping_rental_exists(
+            self.car_id, self.start_date, self.end_date, exclude_rental_id=exclude_rental_id
         )
-        
-        # Exclude the current rental if provided
-        if exclude_rental_id:
-            overlapping_rentals = overlapping_rentals.exclude(id=exclude_rental_id)
-            
-        return not overlapping_rentals.exists()
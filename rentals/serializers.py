@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Rental
+from .models import Rental, overlapping_rental_exists
 from authentication.serializers import UserSerializer
 from cars.serializers import CarSerializer
 
@@ -23,21 +23,14 @@ class RentalSerializer(serializers.ModelSerializer):
             
             # For new rentals, check car availability
             if self.instance is None:
-                rental = Rental(
-                    car=data['car'],
-                    start_date=data['start_date'],
-                    end_date=data['end_date']
-                )
-                if not rental.is_car_available():
+                if overlapping_rental_exists(data['car'].pk, data['start_date'], data['end_date']):
                     raise serializers.ValidationError("This car is not available for the selected dates")
             # For updates, exclude the current rental from the check
             else:
-                rental = Rental(
-                    car=data.get('car', self.instance.car),
-                    start_date=data.get('start_date', self.instance.start_date),
-                    end_date=data.get('end_date', self.instance.end_date)
-                )
-                if not rental.is_car_available(exclude_rental_id=self.instance.id):
+                car_id = data['car'].pk if 'car' in data else self.instance.car_id
+                if overlapping_rental_exists(
+                    car_id, data['start_date'], data['end_date'], exclude_rental_id=self.instance.id
+                ):
                     raise serializers.ValidationError("This car is not available for the selected dates")
         
         return data
\ No newline at end of file
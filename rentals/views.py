@@ -4,6 +4,7 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import Rental
+from authentication.models import User
 from .serializers import RentalSerializer
 from authentication.views import IsAdminOrReadOnly
 
@@ -15,6 +16,8 @@ class RentalViewSet(viewsets.ModelViewSet):
     serializer_class = RentalSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    # These fields span three tables, so no per-table index can serve the OR between
+    # them; rental search is bounded by the rentals table rather than by an index
     search_fields = ['user__username', 'car__car_id', 'status']
     ordering_fields = ['start_date', 'end_date', 'status']
     
@@ -25,9 +28,11 @@ class RentalViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         if user.is_authenticated:
-            if user.role == 'admin':
-                return Rental.objects.all()
-            return Rental.objects.filter(user=user)
+            # The serializer nests the user, the car and the car's location
+            queryset = Rental.objects.select_related('user', 'car', 'car__location')
+            if user.role == User.ROLE_ADMIN:
+                return queryset.all()
+            return queryset.filter(user=user)
         return Rental.objects.none()
     
     def perform_create(self, serializer):
@@ -38,7 +43,7 @@ class RentalViewSet(viewsets.ModelViewSet):
             serializer.save(user=self.request.user)
         else:
             # Only admins can create rentals for other users
-            if self.request.user.role != 'admin' and serializer.validated_data['user'] != self.request.user:
+            if self.request.user.role != User.ROLE_ADMIN and serializer.validated_data['user'] != self.request.user:
                 raise PermissionDenied("You can only create rentals for yourself")
             serializer.save()
     
@@ -48,6 +53,9 @@ class RentalViewSet(viewsets.ModelViewSet):
         Return a list of all active rentals.
         """
         queryset = self.get_queryset().filter(status='active')
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
@@ -56,6 +64,9 @@ class RentalViewSet(viewsets.ModelViewSet):
         """
         Return a list of all rentals for the current user.
         """
-        queryset = Rental.objects.filter(user=request.user)
+        queryset = Rental.objects.select_related('user', 'car', 'car__location').filter(user=request.user)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
\ No newline at end of file
@@ -49,6 +49,8 @@ def test_models():
     try:
         # Setup Django environment
         os.environ.setdefault("DJANGO_SETTINGS_MODULE", "car_rental_system.settings")
+        import django
+        django.setup()
         # Import the test function from test_django_models.py
         sys.path.append(os.getcwd())
         from test_django_models import test_models
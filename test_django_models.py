@@ -1,92 +1,145 @@
 #!/usr/bin/env python
 import os
-import json
+import sys
+import platform
 import django
+from django.db.models import CharField, Count, Value
+from django.db.models.functions import Concat
 from datetime import datetime, timedelta
+from itertools import starmap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from django.db import DatabaseError, close_old_connections, connection, transaction
 
-# Set up Django environment
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "car_rental_system.settings")
-django.setup()
+from api.optional import QuerysetCountWrapper, QuerysetsSingleQueryFetch, orjson
 
-# Now we can import Django models
-from authentication.models import User, LoginHistory
-from cars.models import Car
-from locations.models import Location
-from rentals.models import Rental
+# Bound format methods of the listing templates; starmap() feeds them each row tuple
+# directly, without unpacking the row or re-evaluating an f-string per line
+format_user = "  - {} (Role: {})".format
+format_location = "  - {}: {}".format
+format_car = "  - {} - ID: {}, Status: {}".format
+format_rental = "  - User: {}, Car: {}, Status: {}".format
+
+def write_lines(lines):
+    """Write the lines to stdout in one call instead of one print() per line"""
+    sys.stdout.write(''.join(f"{line}\n" for line in lines))
+
+@contextmanager
+def read_only_transaction():
+    """Run the enclosed queries in one transaction, marked read-only on PostgreSQL"""
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION READ ONLY")
+        yield
+
+def run_in_thread(fetch):
+    """Run fetch in a worker thread on that thread's own database connection"""
+    close_old_connections()
+    try:
+        with read_only_transaction():
+            return fetch()
+    finally:
+        connection.close()
 
 def test_models():
-    """Test Django models by querying data and printing results"""
-    print("=== Django Models Test ===")
+    """Test Django models by querying data and printing results
+
+    Django must already be set up; the models are imported here so that importing
+    this module does not populate the app registry.
+    """
+    from authentication.models import User
+    from cars.models import Car
+    from locations.models import Location
+    from rentals.models import Rental
     
-    # Test User model
-    print("\n--- Users ---")
-    try:
-        users = User.objects.all()
-        print(f"Found {users.count()} users:")
-        for user in users:
-            print(f"  - {user.username} (Role: {user.role})")
-    except Exception as e:
-        print(f"Error fetching users: {str(e)}")
+    print("=== Django Models Test ===")
     
-    # Test Location model
-    print("\n--- Locations ---")
-    try:
-        locations = Location.objects.all()
-        print(f"Found {locations.count()} locations:")
-        for location in locations:
-            print(f"  - {location.name}: {location.address}")
-    except Exception as e:
-        print(f"Error fetching locations: {str(e)}")
+    # The database builds the car labels ("Toyota Camry (2022)") and rental car names,
+    # so each row arrives with one text column instead of the parts
+    car_label = Concat(
+        'make', Value(' '), 'model', Value(' ('), 'year', Value(')'), output_field=CharField()
+    )
+    rental_car_name = Concat('car__make', Value(' '), 'car__model', output_field=CharField())
     
-    # Test Car model
-    print("\n--- Cars ---")
-    try:
-        cars = Car.objects.all()
-        print(f"Found {cars.count()} cars:")
-        for car in cars:
-            print(f"  - {car.make} {car.model} ({car.year}) - ID: {car.car_id}, Status: {car.status}")
-    except Exception as e:
-        print(f"Error fetching cars: {str(e)}")
+    # Each listing fetches plain values_list tuples and returns its formatted lines;
+    # cars and rentals are streamed in chunks so only the lines are kept
+    listings = [
+        ('users', lambda: list(starmap(format_user, User.objects.values_list('username', 'role')))),
+        ('locations', lambda: list(starmap(format_location, Location.objects.values_list('name', 'address')))),
+        ('cars', lambda: list(starmap(format_car, Car.objects.annotate(label=car_label).values_list(
+            'label', 'car_id', 'status'
+        ).iterator(chunk_size=2000)))),
+        # The user__ and car__ lookups join the related tables in the same query
+        ('rentals', lambda: list(starmap(format_rental, Rental.objects.annotate(car_name=rental_car_name).values_list(
+            'user__username', 'car_name', 'status'
+        ).iterator(chunk_size=2000)))),
+    ]
     
-    # Test Rental model
-    print("\n--- Rentals ---")
-    try:
-        rentals = Rental.objects.all()
-        print(f"Found {rentals.count()} rentals:")
-        for rental in rentals:
-            print(f"  - User: {rental.user.username}, Car: {rental.car.make} {rental.car.model}, Status: {rental.status}")
-    except Exception as e:
-        print(f"Error fetching rentals: {str(e)}")
+    # The listings are independent, so their queries run concurrently; the results
+    # are printed from this thread in the original order
+    with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+        futures = [executor.submit(run_in_thread, fetch) for _, fetch in listings]
+        for (name, _), future in zip(listings, futures):
+            print(f"\n--- {name.title()} ---")
+            try:
+                lines = future.result()
+            except DatabaseError as e:
+                print(f"Error fetching {name}: {str(e)}")
+                continue
+            print(f"Found {len(lines)} {name}:")
+            write_lines(lines)
     
     # Test dashboard stats function
     print("\n--- Dashboard Stats ---")
     try:
-        total_cars = Car.objects.count()
-        available_cars = Car.objects.filter(status='available').count()
-        rented_cars = Car.objects.filter(status='rented').count()
-        maintenance_cars = Car.objects.filter(status='maintenance').count()
-        
-        total_rentals = Rental.objects.count()
-        active_rentals = Rental.objects.filter(status='active').count()
-        completed_rentals = Rental.objects.filter(status='completed').count()
+        with read_only_transaction():
+            # Per-status counts from one pass over each table; totals are their sums
+            car_status_counts = Car.objects.order_by().values('status').annotate(count=Count('pk'))
+            rental_status_counts = Rental.objects.order_by().values('status').annotate(count=Count('pk'))
+            users = User.objects.all()
+            
+            if QuerysetsSingleQueryFetch is not None and connection.vendor == 'postgresql':
+                # Send all three queries to PostgreSQL in a single round trip
+                car_rows, rental_rows, total_users = QuerysetsSingleQueryFetch(
+                    querysets=[car_status_counts, rental_status_counts, QuerysetCountWrapper(users)]
+                ).execute()
+            else:
+                car_rows, rental_rows, total_users = list(car_status_counts), list(rental_status_counts), users.count()
         
-        total_users = User.objects.count()
+        car_counts = {row['status']: row['count'] for row in car_rows}
+        rental_counts = {row['status']: row['count'] for row in rental_rows}
         
         stats = {
-            'cars': total_cars,
-            'availableCars': available_cars,
-            'rentedCars': rented_cars,
-            'maintenanceCars': maintenance_cars,
-            'rentals': total_rentals,
-            'activeRentals': active_rentals,
-            'completedRentals': completed_rentals,
+            'cars': sum(car_counts.values()),
+            'availableCars': car_counts.get('available', 0),
+            'rentedCars': car_counts.get('rented', 0),
+            'maintenanceCars': car_counts.get('maintenance', 0),
+            'rentals': sum(rental_counts.values()),
+            'activeRentals': rental_counts.get('active', 0),
+            'completedRentals': rental_counts.get('completed', 0),
             'users': total_users
         }
-        print(json.dumps(stats, indent=2))
-    except Exception as e:
+        if orjson is not None:
+            # Decoded and printed rather than written to sys.stdout.buffer, so the output
+            # stays ordered with the text written above and works with any stdout
+            print(orjson.dumps(stats, option=orjson.OPT_INDENT_2).decode())
+        else:
+            # Same layout as json.dumps(stats, indent=2) without its pure-Python indenting
+            # encoder; the keys are plain names and the values are integers
+            print("{\n" + ",\n".join(f'  "{key}": {value}' for key, value in stats.items()) + "\n}")
+    except DatabaseError as e:
         print(f"Error calculating dashboard stats: {str(e)}")
 
     print("\n=== Test Complete ===")
 
 if __name__ == "__main__":
+    # psycopg2 is a CPython extension; under PyPy, psycopg2cffi stands in for it
+    if platform.python_implementation() == 'PyPy':
+        from psycopg2cffi import compat
+        compat.register()
+    
+    # Set up Django environment
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "car_rental_system.settings")
+    django.setup()
     test_models()
\ No newline at end of file